@@ -1,4 +1,29 @@
 from pygmyhdl import *
+from pygmyhdl import pygmyhdl as _pygmyhdl
+
+
+def fast_clk_sim(clk, num_cycles=10, dly=1):
+    '''
+    Run a simulation for a number of clock cycles without recording any waveforms.
+    Use this instead of clk_sim() for long simulations when the waveforms aren't needed.
+    Parameters:
+        clk: Clock signal to toggle.
+        num_cycles: Number of clock cycles to execute.
+        dly: Time delay between changes of the clock signal.
+    '''
+
+    # Toggle the clock with a single always block instead of a testbench generator.
+    @always(delay(dly))
+    def clk_gen():
+        clk.next = not clk
+
+    # pygmyhdl has no public way to get the logic instances without also getting its
+    # Peeker instances, so this deliberately reads its private _instances list.
+    # Leaving out the Peekers means no signal traces get recorded. The Simulation
+    # flattens the nested instance lists itself.
+    sim = Simulation(clk_gen, _pygmyhdl._instances)
+    sim.run(2 * dly * num_cycles, quiet=1)
+    sim.quit()  # Release the simulator so later simulate()/clk_sim() calls can run.
 
 
 @chunk
@@ -32,27 +57,27 @@ def ramp(clk_i, ramp_o):
         ramp_o: Multi-bit amplitude of ramp.
     '''
 
-    # Delta is the increment (+1) or decrement (-1) for the counter.
-    delta = Bus(len(ramp_o))
+    # Direction of the ramp: low while counting up and high while counting down.
+    # A single flip-flop is enough; there's no need for a full-width +1/-1 register.
+    down = Wire()
 
     @seq_logic(clk_i.posedge)
     def logic():
-        # Add delta to the current ramp value to get the next ramp value.
-        ramp_o.next = ramp_o + delta
+        # Step the ramp up or down to get the next ramp value.
+        if down:
+            ramp_o.next = ramp_o - 1
+        else:
+            ramp_o.next = ramp_o + 1
 
-        # When the ramp reaches the bottom, set delta to +1 to start back up the ramp.
+        # When the ramp reaches the bottom, start back up the ramp.
         if ramp_o == 1:
-            delta.next = 1
-
-        # When the ramp reaches the top, set delta to -1 to start back down the ramp.
-        elif ramp_o == ramp_o.max - 2:
-            delta.next = -1
+            down.next = 0
 
-        # After configuring the FPGA, the delta register is set to zero.
-        # Set it to +1 and set the ramp value to +1 to get things going.
-        elif delta == 0:
-            delta.next = 1
-            ramp_o.next = 1
+        # When the ramp reaches the top, start back down the ramp.
+        # (Kept as a separate if so it isn't converted into a case statement,
+        # which gets the wrong width for this constant in the Verilog.)
+        if ramp_o == ramp_o.max - 2:
+            down.next = 1
 
 @chunk
 def wax_wane(clk_i, led_o, length):
@@ -65,7 +90,7 @@ clk = Wire(name='clk')
 led = Wire(name='led')
 wax_wane(clk, led, 6)  # Set ramp counter to 6 bits: 0, 1, 2, ..., 61, 62, 63, 62, 61, ..., 2, 1, 0, ...
 
-clk_sim(clk, num_cycles=180)
+fast_clk_sim(clk, num_cycles=180)  # Use clk_sim() instead to record the waveforms.
 t = 110  # Look in the middle of the simulation to see if anything is happening.
 #show_waveforms(tick=True, start_time=t, stop_time=t+40)
 
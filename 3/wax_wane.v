@@ -1,6 +1,6 @@
 // File: wax_wane.v
 // Generated by MyHDL 0.11
-// Date: Tue Dec  1 22:21:43 2020
+// Date: Thu Oct 15 09:14:29 2026
 
 
 `timescale 1ns/10ps
@@ -16,32 +16,33 @@ output led_o;
 wire led_o;
 
 reg [22:0] rampout;
-reg [3:0] k_cnt;
-reg [22:0] chunk_insts_0_delta;
+reg [3:0] chunk_insts_0_cnt;
+reg chunk_insts_1_down;
 
 
 
-always @(posedge clk_i) begin: WAX_WANE_LOC_INSTS_CHUNK_INSTS_0_LOC_INSTS_CHUNK_INSTS_K
-    rampout <= (rampout + chunk_insts_0_delta);
-    if ((rampout == 1)) begin
-        chunk_insts_0_delta <= 1;
-    end
-    else if (($signed({1'b0, rampout}) == (8388608 - 2))) begin
-        chunk_insts_0_delta <= (-1);
-    end
-    else if ((chunk_insts_0_delta == 0)) begin
-        chunk_insts_0_delta <= 1;
-        rampout <= 1;
-    end
+always @(posedge clk_i) begin: WAX_WANE_LOC_INSTS_CHUNK_INSTS_0_LOC_INSTS_CHUNK_INSTS_0
+    chunk_insts_0_cnt <= (chunk_insts_0_cnt + 1);
 end
 
 
 
-assign led_o = (k_cnt < rampout[23-1:19]);
+assign led_o = (chunk_insts_0_cnt < rampout[23-1:19]);
 
 
-always @(posedge clk_i) begin: WAX_WANE_LOC_INSTS_CHUNK_INSTS_K_LOC_INSTS_CHUNK_INSTS_K
-    k_cnt <= (k_cnt + 1);
+always @(posedge clk_i) begin: WAX_WANE_LOC_INSTS_CHUNK_INSTS_1_LOC_INSTS_CHUNK_INSTS_0
+    if (chunk_insts_1_down) begin
+        rampout <= (rampout - 1);
+    end
+    else begin
+        rampout <= (rampout + 1);
+    end
+    if ((rampout == 1)) begin
+        chunk_insts_1_down <= 0;
+    end
+    if (($signed({1'b0, rampout}) == (8388608 - 2))) begin
+        chunk_insts_1_down <= 1;
+    end
 end
 
 endmodule
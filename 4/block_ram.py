@@ -1,57 +1,132 @@
+import os
+import random
+from array import array
+
 from pygmyhdl import *
 
+from build import (BUILD_DIR, mark_clock_enables, record_testbench, run_cpp_testbench, toCppTestbench,
+                   toVerilog_cached, verilate)
+
+
+def _ram_step(mem, wr, addr, din):
+    '''Return the RAM word at addr and then overwrite it with din if wr is high.'''
+    dout = mem[addr]
+    if wr:
+        mem[addr] = din
+    return dout
+
+
+def _packed_ram_step(mem, wr, addr, din):
+    '''Same as _ram_step() but for a 1-bit wide RAM with 64 bits packed into each word.'''
+    word, bit = addr >> 6, addr & 63
+    dout = (mem[word] >> bit) & 1
+    if wr:
+        mem[word] = (mem[word] & ~(1 << bit)) | (din << bit)
+    return dout
+
+
+def _sim_ram(width, depth):
+    '''
+    Create a zeroed RAM array using the narrowest unsigned type that holds width bits.
+    Returns the array and the step function for reading/writing it.
+    '''
+    if width == 1:
+        # Pack single-bit RAMs into 64-bit words.
+        return array('Q', [0]) * ((depth + 63) // 64), _packed_ram_step
+    for typecode in 'BHIQ':
+        if width <= 8 * array(typecode).itemsize:
+            return array(typecode, [0]) * depth, _ram_step
+    return [0] * depth, _ram_step  # Too wide for an array, so fall back to a list of Python ints.
+
+
+def _check_packed_ram(depth=2048, num_ops=20000):
+    '''
+    Check the packed 1-bit RAM model against a plain list of bits using random reads and writes.
+    Nothing in this script simulates a 1-bit RAM, so this is the only test of _packed_ram_step().
+    '''
+    rng = random.Random(0)
+    mem, ram_step = _sim_ram(1, depth)
+    model = [0] * depth
+    for _ in range(num_ops):
+        wr, addr, din = rng.randint(0, 1), rng.randrange(depth), rng.randint(0, 1)
+        dout = ram_step(mem, wr, addr, din)
+        if dout != model[addr]:
+            raise Exception('Packed RAM read {} from address {} instead of {}.'.format(dout, addr, model[addr]))
+        if wr:
+            model[addr] = din
+
 
 @chunk
-def ram(clk_i, wr_i, addr_i, data_i, data_o):
+def ram(clk_i, wr_i, addr_i, data_i, data_o, fast_sim=False):
     '''
     Inputs:
       clk_i:  Data is read/written on the rising edge of this clock input.
       wr_i:   When high, data is written to the RAM; when low, data is read from the RAM.
       addr_i: Address bus for selecting which RAM location is being read/written.
       data_i: Data bus for writing data into the RAM.
+      fast_sim: When True, back the RAM with a flat array of integers instead of a list
+                of Bus objects. This is much faster to simulate but can't be converted to Verilog.
     Outputs:
       data_o: Data bus for reading data from the RAM.
     '''
 
-    mem = [Bus(len(data_i)) for _ in range(2 ** len(addr_i))]
+    if fast_sim:
+        mem, ram_step = _sim_ram(len(data_i), 2 ** len(addr_i))
 
-    @seq_logic(clk_i.posedge)
-    def logic():
-        if wr_i:
-            mem[addr_i.val].next = data_i
-        else:
-            data_o.next = mem[addr_i.val]
+        @seq_logic(clk_i.posedge)
+        def logic():
+            dout = ram_step(mem, wr_i, int(addr_i), int(data_i))
+            if not wr_i:
+                data_o.next = dout
+    else:
+        mem = [Bus(len(data_i)) for _ in range(2 ** len(addr_i))]
+
+        @seq_logic(clk_i.posedge)
+        def logic():
+            if wr_i:
+                mem[addr_i.val].next = data_i
+            else:
+                data_o.next = mem[addr_i.val]
 
 
-toVerilog(ram, clk_i=Wire(), wr_i=Wire(), addr_i=Bus(8), data_i=Bus(8), data_o=Bus(8))
+toVerilog_cached(ram, clk_i=Wire(), wr_i=Wire(), addr_i=Bus(8), data_i=Bus(8), data_o=Bus(8))
 
 
 @chunk
-def simpler_ram(clk_i, wr_i, addr_i, data_i, data_o):
+def simpler_ram(clk_i, wr_i, addr_i, data_i, data_o, fast_sim=False):
     '''
     Inputs:
       clk_i:  Data is read/written on the rising edge of this clock input.
       wr_i:   When high, data is written to the RAM; when low, data is read from the RAM.
       addr_i: Address bus for selecting which RAM location is being read/written.
       data_i: Data bus for writing data into the RAM.
+      fast_sim: When True, back the RAM with a flat array of integers instead of a list
+                of Bus objects. This is much faster to simulate but can't be converted to Verilog.
     Outputs:
       data_o: Data bus for reading data from the RAM.
     '''
 
-    mem = [Bus(len(data_i)) for _ in range(2 ** len(addr_i))]
+    if fast_sim:
+        mem, ram_step = _sim_ram(len(data_i), 2 ** len(addr_i))
 
-    @seq_logic(clk_i.posedge)
-    def logic():
-        if wr_i:
-            mem[addr_i.val].next = data_i
-        data_o.next = mem[addr_i.val]  # RAM address is always read out!
+        @seq_logic(clk_i.posedge)
+        def logic():
+            data_o.next = ram_step(mem, wr_i, int(addr_i), int(data_i))  # RAM address is always read out!
+    else:
+        mem = [Bus(len(data_i)) for _ in range(2 ** len(addr_i))]
+
+        @seq_logic(clk_i.posedge)
+        def logic():
+            if wr_i:
+                mem[addr_i.val].next = data_i
+            data_o.next = mem[addr_i.val]  # RAM address is always read out!
 
 
-toVerilog(simpler_ram, clk_i=Wire(), wr_i=Wire(), addr_i=Bus(8), data_i=Bus(8), data_o=Bus(8))
+toVerilog_cached(simpler_ram, clk_i=Wire(), wr_i=Wire(), addr_i=Bus(8), data_i=Bus(8), data_o=Bus(8))
 
 
 @chunk
-def dualport_ram(clk_i, wr_i, wr_addr_i, rd_addr_i, data_i, data_o):
+def dualport_ram(clk_i, wr_i, wr_addr_i, rd_addr_i, data_i, data_o, fast_sim=False):
     '''
     Inputs:
       clk_i:     Data is read/written on the rising edge of this clock input.
@@ -59,17 +134,28 @@ def dualport_ram(clk_i, wr_i, wr_addr_i, rd_addr_i, data_i, data_o):
       wr_addr_i: Address bus for selecting which RAM location is being written.
       rd_addr_i: Address bus for selecting which RAM location is being read.
       data_i:    Data bus for writing data into the RAM.
+      fast_sim:  When True, back the RAM with a flat array of integers instead of a list
+                 of Bus objects. This is much faster to simulate but can't be converted to Verilog.
     Outputs:
       data_o:    Data bus for reading data from the RAM.
     '''
 
-    mem = [Bus(len(data_i)) for _ in range(2 ** len(wr_addr_i))]
+    if fast_sim:
+        mem, ram_step = _sim_ram(len(data_i), 2 ** len(wr_addr_i))
 
-    @seq_logic(clk_i.posedge)
-    def logic():
-        if wr_i:
-            mem[wr_addr_i.val].next = data_i
-        data_o.next = mem[rd_addr_i.val]  # Read from a different location than write.
+        @seq_logic(clk_i.posedge)
+        def logic():
+            # Read before writing so a write to the read address shows up on the next clock.
+            data_o.next = ram_step(mem, 0, int(rd_addr_i), 0)
+            ram_step(mem, wr_i, int(wr_addr_i), int(data_i))
+    else:
+        mem = [Bus(len(data_i)) for _ in range(2 ** len(wr_addr_i))]
+
+        @seq_logic(clk_i.posedge)
+        def logic():
+            if wr_i:
+                mem[wr_addr_i.val].next = data_i
+            data_o.next = mem[rd_addr_i.val]  # Read from a different location than write.
 
 
 initialize()
@@ -82,21 +168,22 @@ rd_addr = Bus(8, name='rd_addr')  # Second address bus for reads.
 data_i = Bus(8, name='data_i')
 data_o = Bus(8, name='data_o')
 
-# Instantiate the RAM.
-dualport_ram(clk_i=clk, wr_i=wr, wr_addr_i=wr_addr, rd_addr_i=rd_addr, data_i=data_i, data_o=data_o)
+# Instantiate the RAM with the fast RAM model since it's only simulated here.
+dualport_ram(clk_i=clk, wr_i=wr, wr_addr_i=wr_addr, rd_addr_i=rd_addr, data_i=data_i, data_o=data_o, fast_sim=True)
 
 
 def ram_test_bench():
-    for i in range(10):  # Perform 10 RAM writes and reads.
+    # Perform 10 RAM writes and reads. Build all the stimulus values up front.
+    n = 10
+    wr_vals = [1] * n
+    wr_addr_vals = list(range(n))  # Write data to address i.
+    data_vals = [3 * i + 1 for i in range(n)]
 
-        # Write data to address i.
-        wr_addr.next = i
-        data_i.next = 3 * i + 1
-        wr.next = 1
+    # Read data from address i-3. After three clocks, the data that entered
+    # on the data_i bus will start to appear on the data_o bus.
+    rd_addr_vals = [i - 3 for i in range(n)]
 
-        # Read data from address i-3. After three clocks, the data that entered
-        # on the data_i bus will start to appear on the data_o bus.
-        rd_addr.next = i - 3
+    for wr.next, wr_addr.next, data_i.next, rd_addr.next in zip(wr_vals, wr_addr_vals, data_vals, rd_addr_vals):
 
         # Pulse the clock to trigger the write and read operations.
         clk.next = 0
@@ -105,8 +192,48 @@ def ram_test_bench():
         yield delay(1)
 
 
-# Simulate the RAM using the test bench.
-simulate(ram_test_bench())
+# Simulate the RAM using the test bench. Record the stimulus and the outputs so the
+# same test can be checked against a compiled Verilator simulation later.
+ram_inputs = dict(clk_i=clk, wr_i=wr, wr_addr_i=wr_addr, rd_addr_i=rd_addr, data_i=data_i)
+ram_outputs = dict(data_o=data_o)
+ram_tb, ram_stim, ram_expected = record_testbench(ram_test_bench(), ram_inputs, ram_outputs)
+simulate(ram_tb)
+
+
+@chunk
+def ram_ce(clk_i, ce_i, wr_i, addr_i, data_i, data_o, fast_sim=False):
+    '''
+    Inputs:
+      clk_i:  Data is read/written on the rising edge of this clock input.
+      ce_i:   Clock enable. The RAM ignores the clock edge unless this is high.
+      wr_i:   When high, data is written to the RAM; when low, data is read from the RAM.
+      addr_i: Address bus for selecting which RAM location is being read/written.
+      data_i: Data bus for writing data into the RAM.
+      fast_sim: When True, back the RAM with a flat array of integers instead of a list
+                of Bus objects. This is much faster to simulate but can't be converted to Verilog.
+    Outputs:
+      data_o: Data bus for reading data from the RAM.
+    '''
+
+    if fast_sim:
+        mem, ram_step = _sim_ram(len(data_i), 2 ** len(addr_i))
+
+        @seq_logic(clk_i.posedge)
+        def logic():
+            if ce_i:
+                dout = ram_step(mem, wr_i, int(addr_i), int(data_i))
+                if not wr_i:
+                    data_o.next = dout
+    else:
+        mem = [Bus(len(data_i)) for _ in range(2 ** len(addr_i))]
+
+        @seq_logic(clk_i.posedge)
+        def logic():
+            if ce_i:
+                if wr_i:
+                    mem[addr_i.val].next = data_i
+                else:
+                    data_o.next = mem[addr_i.val]
 
 
 @chunk
@@ -118,18 +245,16 @@ def gen_reset(clk_i, reset_o):
     Outputs:
         reset_o: Active-high reset pulse.
     '''
-    cntr = Bus(1)  # Reset counter.
+    cntr = Bus(1)  # Set once the reset pulse has been generated.
 
     @seq_logic(clk_i.posedge)
     def logic():
-        if cntr < 1:
-            # Generate a reset while the counter is less than some threshold
-            # and increment the counter.
-            cntr.next = cntr.next + 1
+        if not cntr:
+            # Generate a reset on the first clock and remember that it was done.
+            cntr.next = 1
             reset_o.next = 1
         else:
-            # Release the reset once the counter passes the threshold and
-            # stop incrementing the counter.
+            # Release the reset after that.
             reset_o.next = 0
 
 
@@ -146,18 +271,23 @@ def sample_en(clk_i, do_sample_o, frq_in=12e6, frq_sample=100):
     '''
     # Compute the width of the counter and when it should roll-over based
     # on the master clock frequency and the desired sampling frequency.
+    # These are fixed when the circuit is built, so the counter can count down
+    # from the rollover value and just check for zero instead of comparing
+    # against an arbitrary constant. The rollover value becomes a constant that
+    # is loaded into the counter in parallel.
     from math import ceil, log2
     rollover = int(ceil(frq_in / frq_sample)) - 1
-    cntr = Bus(int(ceil(log2(frq_in / frq_sample))))
+    cntr = Bus(int(ceil(log2(frq_in / frq_sample))), init_val=rollover)
 
     # Sequential logic for generating the sampling pulse.
     @seq_logic(clk_i.posedge)
     def counter():
-        cntr.next = cntr + 1  # Increment the counter.
-        do_sample_o.next = 0  # Clear the sampling pulse output except...
-        if cntr == rollover:
-            do_sample_o.next = 1  # ...when the counter rolls over.
-            cntr.next = 0
+        if cntr == 0:
+            cntr.next = rollover  # Reload the counter when it reaches zero...
+            do_sample_o.next = 1  # ...and send out the sampling pulse.
+        else:
+            cntr.next = cntr - 1  # Decrement the counter.
+            do_sample_o.next = 0  # Keep the sampling pulse output low.
 
 
 @chunk
@@ -180,74 +310,110 @@ def record_play(clk_i, button_a, button_b, leds_o):
     do_sample = Wire()
     sample_en(clk_i, do_sample)
 
+    # The controller only updates the RAM controls when a sample is taken, so
+    # enable the RAM just on the following clock when those controls are valid.
+    ram_en = Wire()
+
+    @seq_logic(clk_i.posedge)
+    def ram_en_logic():
+        ram_en.next = do_sample
+
     # Instantiate a RAM for holding the samples.
     wr = Wire()
     addr = Bus(11)
     end_addr = Bus(len(addr))  # Holds the last address of the recorded samples.
     data_i = Bus(1)
     data_o = Bus(1)
-    ram(clk_i, wr, addr, data_i, data_o)
+    ram_ce(clk_i, ram_en, wr, addr, data_i, data_o)
 
-    # States of the record/playback controller.
-    state = Bus(3)  # Holds the current state of the controller.
+    # States of the record/playback controller. The state is one-hot encoded,
+    # so each of these is the index of the state bit that's set in that state.
     INIT = 0  # Initialize. The reset pulse sends us here.
     WAITING_TO_RECORD = 1  # Getting read to record samples.
     RECORDING = 2  # Actually storing samples in RAM.
     WAITING_TO_PLAY = 3  # Getting ready to play back samples.
     PLAYING = 4  # Actually playing back samples.
+    state = Bus(5, init_val=1 << INIT)  # Holds the current state of the controller.
+
+    # The next values of the RAM write-control and address are computed here so
+    # the controller only has to assign each of them in one place.
+    wr_next = Wire()
+    addr_next = Bus(len(addr))
+
+    @comb_logic
+    def wr_logic():
+        # Write button B to RAM on every sample from the start of recording until it ends.
+        wr_next.next = do_sample and not reset and (state[RECORDING] or (state[WAITING_TO_RECORD] and not button_a))
+
+    @comb_logic
+    def addr_logic():
+        if state[RECORDING] or (state[PLAYING] and addr != end_addr):
+            addr_next.next = addr + 1  # Next location for storing or playing a sample.
+        elif state[INIT]:
+            addr_next.next = addr  # The address isn't used until recording starts.
+        else:
+            # Start recording/playback from the beginning of RAM, and loop back
+            # there after playing the last sample.
+            addr_next.next = 0
 
     # Sequential logic for the record/playback controller.
     @seq_logic(clk_i.posedge)
     def fsm():
 
-        wr.next = 0  # Keep the RAM write-control off by default.
+        wr.next = wr_next  # The RAM write-control is only on while recording samples.
 
         if reset:  # Initialize the controller using the pulse from the reset generator.
-            state.next = INIT  # Go to the INIT state after the reset is released.
+            state.next = 1 << INIT  # Go to the INIT state after the reset is released.
 
         elif do_sample:  # Process a sample whenever the sampling pulse arrives.
 
-            if state == INIT:  # Initialize the controller.
+            addr.next = addr_next  # Move to the RAM address for this sample.
+
+            if state[INIT]:  # Initialize the controller.
                 leds_o.next = 0b10101  # Light LEDs to indicate the INIT state.
                 if button_a == 1:
                     # Get ready to start recording when button A is pressed.
-                    state.next = WAITING_TO_RECORD  # Go to record setup state.
+                    state.next = 1 << WAITING_TO_RECORD  # Go to record setup state.
 
-            elif state == WAITING_TO_RECORD:  # Setup for recording.
+            elif state[WAITING_TO_RECORD]:  # Setup for recording.
                 leds_o.next = 0b11010  # Light LEDs to indicate this state.
                 if button_a == 0:
                     # Start recording once button A is released.
-                    addr.next = 0  # Start recording from beginning of RAM.
                     data_i.next = button_b  # Record the state of button B.
-                    wr.next = 1  # Write button B state to RAM.
-                    state.next = RECORDING  # Go to recording state.
+                    state.next = 1 << RECORDING  # Go to recording state.
 
-            elif state == RECORDING:  # Record samples of button B to RAM.
-                addr.next = addr + 1  # Next location for storing sample.
+            elif state[RECORDING]:  # Record samples of button B to RAM.
                 data_i.next = button_b  # Sample state of button B.
-                wr.next = 1  # Write button B state to RAM.
                 # For feedback to the user, display the state of button B on the LEDs.
-                leds_o.next = concat(1, button_b, button_b, button_b, button_b)
+                leds_o.next = 0b11111 if button_b else 0b10000
                 if button_a == 1:
                     # If button A pressed, then get ready to play back the stored samples.
                     end_addr.next = addr + 1  # Store the last sample address.
-                    state.next = WAITING_TO_PLAY  # Go to playback setup state.
+                    state.next = 1 << WAITING_TO_PLAY  # Go to playback setup state.
 
-            elif state == WAITING_TO_PLAY:  # Setup for playback.
+            elif state[WAITING_TO_PLAY]:  # Setup for playback.
                 leds_o.next = 0b10000  # Light LEDs to indicate this state.
                 if button_a == 0:
                     # Start playback once button A is released.
-                    addr.next = 0  # Start playback from beginning of RAM.
-                    state.next = PLAYING  # Go to playback state.
-
-            elif state == PLAYING:  # Show recorded state of button B on the LEDs.
-                leds_o.next = concat(1, data_o[0], data_o[0], data_o[0], data_o[0])
-                addr.next = addr + 1  # Advance to the next sample.
-                if addr == end_addr:
-                    # Loop back to the start of RAM if this is the last sample.
-                    addr.next = 0
+                    state.next = 1 << PLAYING  # Go to playback state.
+
+            elif state[PLAYING]:  # Show recorded state of button B on the LEDs.
+                leds_o.next = 0b11111 if data_o[0] else 0b10000
                 if button_a == 1:
                     # Record a new sample if button A is pressed.
-                    state.next = WAITING_TO_RECORD
+                    state.next = 1 << WAITING_TO_RECORD
+
+toVerilog_cached(record_play, clk_i=Wire(), button_a=Wire(), button_b=Wire(), leds_o=Bus(5))
+
+if __name__ == '__main__':
+    # Check the fast RAM model used for 1-bit RAMs like the one in record_play.
+    _check_packed_ram()
+
+    # Build a fast Verilator model of the record/playback design.
+    verilate(mark_clock_enables('record_play.v', ['reset', 'do_sample']))
 
-toVerilog(record_play, clk_i=Wire(), button_a=Wire(), button_b=Wire(), leds_o=Bus(5))
+    # Replay the dual-port RAM test bench in a compiled Verilator simulation
+    # and check that it gives the same outputs as the MyHDL simulation.
+    toVerilog_cached(dualport_ram, directory=BUILD_DIR, **dict(ram_inputs, **ram_outputs))
+    toCppTestbench(ram_stim, 'dualport_ram', list(ram_inputs), list(ram_outputs))
+    run_cpp_testbench(os.path.join(BUILD_DIR, 'dualport_ram.v'), 'dualport_ram', ram_expected)
@@ -0,0 +1,224 @@
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+
+from myhdl import SignalType, toVerilog
+
+# Where toVerilog_cached() keeps previously generated Verilog files.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pygmyhdl')
+
+# Where the Verilator models and C++ testbenches are built.
+BUILD_DIR = 'build'
+
+
+def toVerilog_cached(func, *args, directory='', **kwargs):
+    '''
+    Same as toVerilog() but reuses the Verilog from an earlier run if nothing changed.
+    Parameters:
+        func: Chunk function to convert.
+        args, kwargs: Arguments for func, same as for toVerilog().
+        directory: Where to write the Verilog files (defaults to the current directory).
+    The cache key is the function name, the widths of any signal arguments, the values
+    of any other arguments, and the contents of the source file that defines func.
+    Hashing the whole file catches changes to any sub-chunks defined in it.
+    '''
+
+    def shape(arg):
+        return ('signal', len(arg)) if isinstance(arg, SignalType) else arg
+
+    with open(func.__code__.co_filename, 'rb') as f:
+        source = f.read()
+    key = repr((
+        func.__name__,
+        [shape(a) for a in args],
+        sorted((k, shape(v)) for k, v in kwargs.items()),
+    )).encode() + source
+    digest = hashlib.sha1(key).hexdigest()
+
+    # toVerilog() writes the design and a testbench for it.
+    names = [func.__name__ + '.v', 'tb_' + func.__name__ + '.v']
+    vfiles = [os.path.join(directory, name) for name in names]
+    cached = [os.path.join(CACHE_DIR, digest + '_' + name) for name in names]
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if os.path.exists(cached[0]):
+        for c, vfile in zip(cached, vfiles):
+            if os.path.exists(c):
+                shutil.copyfile(c, vfile)
+        return
+
+    # toVerilog keeps its directory setting between calls, so put it back afterwards.
+    toVerilog.directory = directory or None
+    try:
+        toVerilog(func, *args, **kwargs)
+    finally:
+        toVerilog.directory = None
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for c, vfile in zip(cached, vfiles):
+        if os.path.exists(vfile):
+            shutil.copyfile(vfile, c)
+
+
+def mark_clock_enables(vfile, wires):
+    '''
+    Write a copy of a generated Verilog file into BUILD_DIR with some wires tagged as
+    clock enables for Verilator.
+    Parameters:
+        vfile: Verilog file written by toVerilog().
+        wires: Names of the signals that gate the sequential logic. These are the
+               names in the flattened Verilog (e.g. do_sample, not do_sample_o).
+    Returns:
+        The path of the tagged copy.
+    '''
+    with open(vfile) as f:
+        verilog = f.read()
+
+    for wire in wires:
+        # Put the pragma right after the signal name in its declaration, e.g.
+        #   reg do_sample /*verilator clock_enable*/;
+        decl = re.compile(r'^(\s*(?:reg|wire)\b[^;]*\b{})\s*;'.format(re.escape(wire)), re.MULTILINE)
+        verilog, count = decl.subn(r'\1 /*verilator clock_enable*/;', verilog)
+        if count == 0:
+            raise Exception('No declaration of {} found in {}.'.format(wire, vfile))
+
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    tagged_vfile = os.path.join(BUILD_DIR, os.path.basename(vfile))
+    with open(tagged_vfile, 'w') as f:
+        f.write(verilog)
+    return tagged_vfile
+
+
+def verilate(vfile, threads=2):
+    '''
+    Compile a generated Verilog file into an optimized, multithreaded C++ model in BUILD_DIR.
+    Parameters:
+        vfile: Verilog file written by toVerilog().
+        threads: Number of threads the Verilator model will use.
+    Returns:
+        The finished Verilator process, or None if Verilator isn't installed.
+    '''
+    if not shutil.which('verilator'):
+        print('Verilator not found, so {} was not verilated.'.format(vfile))
+        return None
+
+    top = os.path.splitext(os.path.basename(vfile))[0]
+    cmd = [
+        'verilator', '--cc', vfile,
+        '--Mdir', os.path.join(BUILD_DIR, 'obj_' + top),
+        '-O3',                     # Enables the combinational logic folding passes.
+        '--x-assign', 'fast',      # Don't preserve X's in the simulation.
+        '--threads', str(threads),
+        '--output-split', '20000', # Split the C++ into files that compile in parallel.
+    ]
+    return subprocess.run(cmd, check=True)
+
+
+def record_testbench(testbench, inputs, outputs):
+    '''
+    Wrap a testbench so it records its stimulus and the resulting outputs while it's simulated.
+    Parameters:
+        testbench: Testbench generator (like the ones passed to simulate()).
+        inputs: Dict mapping the top-level input port names to the signals the testbench drives.
+        outputs: Dict mapping the top-level output port names to the signals to record.
+    Returns:
+        The wrapped testbench to pass to simulate(), a list that gets the input values
+        for each testbench step, and a list that gets the output values after each step.
+    '''
+    stim, expected = [], []
+
+    def recorder():
+        for trigger in testbench:
+            # The testbench has just set up the inputs for this step.
+            stim.append([int(sig.next) for sig in inputs.values()])
+            yield trigger
+            # The logic has settled once the testbench's delay is over.
+            expected.append([int(sig) for sig in outputs.values()])
+
+    return recorder(), stim, expected
+
+
+def toCppTestbench(stim, top, inputs, outputs, cpp_file='sim_main.cpp', results_file='results.txt'):
+    '''
+    Write a Verilator C++ testbench that replays the stimulus recorded from a Python testbench.
+    Parameters:
+        stim: Input values for each step, as recorded by record_testbench().
+        top: Name of the top-level Verilog module.
+        inputs: Names of the top-level input ports, in the same order as the stim values.
+        outputs: Names of the top-level output ports to record after each step.
+        cpp_file: Name of the C++ file to write in BUILD_DIR.
+        results_file: Name of the file in BUILD_DIR where the compiled testbench writes the output values.
+    Ports have to be 64 bits wide or less.
+    '''
+    stim_rows = ',\n'.join('    {' + ', '.join('{}ULL'.format(v) for v in row) + '}' for row in stim)
+    set_inputs = '\n'.join(
+        '        top->{} = v[{}];'.format(port, i) for i, port in enumerate(inputs)
+    )
+    fmt = ' '.join(['%llu'] * len(outputs))
+    get_outputs = ', '.join('(unsigned long long)top->{}'.format(port) for port in outputs)
+
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with open(os.path.join(BUILD_DIR, cpp_file), 'w') as f:
+        f.write('''#include <cstdint>
+#include <cstdio>
+#include "verilated.h"
+#include "V{top}.h"
+
+static const uint64_t stim[][{num_inputs}] = {{
+{stim_rows}
+}};
+
+int main(int argc, char** argv) {{
+    Verilated::commandArgs(argc, argv);
+    V{top}* top = new V{top};
+    FILE* results = fopen("{results_file}", "w");
+    for (const auto& v : stim) {{
+{set_inputs}
+        top->eval();
+        fprintf(results, "{fmt}\\n", {get_outputs});
+    }}
+    fclose(results);
+    top->final();
+    delete top;
+    return 0;
+}}
+'''.format(top=top, num_inputs=len(inputs), stim_rows=stim_rows, results_file=results_file,
+           set_inputs=set_inputs, fmt=fmt, get_outputs=get_outputs))
+
+
+def run_cpp_testbench(vfile, top, expected, cpp_file='sim_main.cpp', results_file='results.txt'):
+    '''
+    Build and run a testbench written by toCppTestbench() with Verilator and check its outputs.
+    Parameters:
+        vfile: Verilog file written by toVerilog().
+        top: Name of the top-level Verilog module.
+        expected: Output values for each step, as recorded by record_testbench().
+        cpp_file: Name of the C++ testbench file in BUILD_DIR.
+        results_file: Name of the file in BUILD_DIR where the testbench writes the output values.
+    Returns:
+        A list with the output values for each testbench step, or None if Verilator isn't installed.
+    Raises an exception if the Verilator outputs don't match the expected outputs.
+    '''
+    if not shutil.which('verilator'):
+        print('Verilator not found, so the {} testbench was not run.'.format(top))
+        return None
+
+    mdir = os.path.join(BUILD_DIR, 'obj_' + top)
+    subprocess.run(['verilator', '--cc', '--exe', '--build', '-O3', '--Mdir', mdir,
+                    os.path.join(BUILD_DIR, cpp_file), vfile], check=True)
+    # Run the testbench from BUILD_DIR so its results file ends up there.
+    subprocess.run([os.path.abspath(os.path.join(mdir, 'V' + top))], cwd=BUILD_DIR, check=True)
+
+    with open(os.path.join(BUILD_DIR, results_file)) as f:
+        results = [[int(v) for v in line.split()] for line in f]
+
+    if len(results) != len(expected):
+        raise Exception('Verilator ran {} steps of the {} testbench but {} were expected.'.format(
+            len(results), top, len(expected)))
+    for step, (result, exp) in enumerate(zip(results, expected)):
+        if result != exp:
+            raise Exception('Verilator output {} differs from MyHDL output {} at step {} of the {} testbench.'.format(
+                result, exp, step, top))
+    return results
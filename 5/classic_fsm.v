@@ -1,6 +1,6 @@
 // File: classic_fsm.v
 // Generated by MyHDL 0.11
-// Date: Wed Dec  2 15:42:45 2020
+// Date: Thu Oct 15 09:13:56 2026
 
 
 `timescale 1ns/10ps
@@ -15,134 +15,76 @@ module classic_fsm (
 input clk_i;
 input [1:0] inputs_i;
 output [3:0] outputs_o;
-reg [3:0] outputs_o;
+wire [3:0] outputs_o;
 
-reg [1:0] fsm_state;
-wire [1:0] input_chgs;
+wire [3:0] table_addr;
+reg [1:0] dbnc_inputs;
 reg [1:0] prev_inputs;
-wire [1:0] dbnc_inputs;
+reg [1:0] fsm_state;
 reg [1:0] reset_cnt;
-reg chunk_insts_1_button_o;
-reg [16:0] chunk_insts_1_debounce_cnt;
-reg chunk_insts_1_prev_button;
-reg k_button_o;
-reg [16:0] k_debounce_cnt;
-reg k_prev_button;
-wire [1:0] k_chunk_insts_2_a;
-
-assign k_chunk_insts_2_a[1] = chunk_insts_1_button_o;
-assign k_chunk_insts_2_a[0] = k_button_o;
-
-
-always @(fsm_state) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_0_C
-    case (fsm_state)
-        2'b00: begin
-            outputs_o = 1;
-        end
-        2'b01: begin
-            outputs_o = 2;
-        end
-        2'b10: begin
-            outputs_o = 4;
-        end
-        2'b11: begin
-            outputs_o = 8;
-        end
-        default: begin
-            outputs_o = 15;
-        end
-    endcase
-end
+wire [1:0] input_chgs;
+reg [1:0] chunk_insts_4_prev_inputs;
+reg [16:0] chunk_insts_4_debounce_cnt;
 
 
-always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_1_LOC_INSTS_CHUNK_INSTS_0
-    if ((chunk_insts_1_debounce_cnt == 0)) begin
-        chunk_insts_1_button_o <= chunk_insts_1_prev_button;
-    end
-end
 
 
-always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_1_LOC_INSTS_CHUNK_INSTS_K
-    if ((inputs_i[1] == chunk_insts_1_prev_button)) begin
-        if ((chunk_insts_1_debounce_cnt != 0)) begin
-            chunk_insts_1_debounce_cnt <= (chunk_insts_1_debounce_cnt - 1);
-        end
-    end
-    else begin
-        chunk_insts_1_debounce_cnt <= 120000;
-    end
-    chunk_insts_1_prev_button <= inputs_i[1];
-end
+assign input_chgs = (dbnc_inputs & (~prev_inputs));
 
 
 
-assign dbnc_inputs = k_chunk_insts_2_a;
+assign outputs_o = (1 << fsm_state);
 
 
-always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_3
+always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_2
     if (($signed({1'b0, reset_cnt}) < (4 - 1))) begin
-        fsm_state <= 2'b00;
+        fsm_state <= 0;
         reset_cnt <= (reset_cnt + 1);
     end
-    else if ((fsm_state == 2'b00)) begin
-        if (input_chgs[0]) begin
-            fsm_state <= 2'b01;
-        end
-        else if (input_chgs[1]) begin
-            fsm_state <= 2'b11;
-        end
-    end
-    else if ((fsm_state == 2'b01)) begin
-        if (input_chgs[0]) begin
-            fsm_state <= 2'b10;
-        end
-        else if (input_chgs[1]) begin
-            fsm_state <= 2'b00;
-        end
-    end
-    else if ((fsm_state == 2'b10)) begin
-        if (input_chgs[0]) begin
-            fsm_state <= 2'b11;
-        end
-        else if (input_chgs[1]) begin
-            fsm_state <= 2'b01;
-        end
-    end
-    else if ((fsm_state == 2'b11)) begin
-        if (input_chgs[0]) begin
-            fsm_state <= 2'b00;
-        end
-        else if (input_chgs[1]) begin
-            fsm_state <= 2'b10;
-        end
-    end
     else begin
-        fsm_state <= 2'b00;
+        case (table_addr)
+            0: fsm_state <= 0;
+            1: fsm_state <= 1;
+            2: fsm_state <= 3;
+            3: fsm_state <= 1;
+            4: fsm_state <= 1;
+            5: fsm_state <= 2;
+            6: fsm_state <= 0;
+            7: fsm_state <= 2;
+            8: fsm_state <= 2;
+            9: fsm_state <= 3;
+            10: fsm_state <= 1;
+            11: fsm_state <= 3;
+            12: fsm_state <= 3;
+            13: fsm_state <= 0;
+            14: fsm_state <= 2;
+            default: fsm_state <= 0;
+        endcase
     end
     prev_inputs <= dbnc_inputs;
 end
 
 
 
-assign input_chgs = (dbnc_inputs & (~prev_inputs));
+assign table_addr = {fsm_state, input_chgs};
 
 
-always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_K_LOC_INSTS_CHUNK_INSTS_0
-    if ((inputs_i[0] == k_prev_button)) begin
-        if ((k_debounce_cnt != 0)) begin
-            k_debounce_cnt <= (k_debounce_cnt - 1);
+always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_4_LOC_INSTS_CHUNK_INSTS_0
+    if ((inputs_i == chunk_insts_4_prev_inputs)) begin
+        if ((chunk_insts_4_debounce_cnt != 0)) begin
+            chunk_insts_4_debounce_cnt <= (chunk_insts_4_debounce_cnt - 1);
         end
     end
     else begin
-        k_debounce_cnt <= 120000;
+        chunk_insts_4_debounce_cnt <= 120000;
     end
-    k_prev_button <= inputs_i[0];
+    chunk_insts_4_prev_inputs <= inputs_i;
 end
 
 
-always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_K_LOC_INSTS_CHUNK_INSTS_K
-    if ((k_debounce_cnt == 0)) begin
-        k_button_o <= k_prev_button;
+always @(posedge clk_i) begin: CLASSIC_FSM_LOC_INSTS_CHUNK_INSTS_4_LOC_INSTS_CHUNK_INSTS_1
+    if ((chunk_insts_4_debounce_cnt == 0)) begin
+        dbnc_inputs <= chunk_insts_4_prev_inputs;
     end
 end
 
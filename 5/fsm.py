@@ -2,46 +2,58 @@ from pygmyhdl import *
 
 
 @chunk
-def debouncer(clk_i, button_i, button_o, debounce_time):
+def debouncer_bus(clk_i, inputs_i, outputs_o, debounce_time):
     '''
     Inputs:
         clk_i: Main clock input.
-        button_i: Raw button input.
-        button_o: Debounced button output.
-        debounce_time: Number of clock cycles the button value has to be stable.
+        inputs_i: Raw button inputs.
+        outputs_o: Debounced button outputs.
+        debounce_time: Number of clock cycles the button values have to be stable.
     '''
 
-    # These are the state variables of the FSM.
+    # These are the state variables of the FSM. A single counter is shared by all the inputs.
     from math import ceil, log2
     debounce_cnt = Bus(int(ceil(log2(debounce_time + 1))), name='dbcnt')  # Counter big enough to store debounce time.
-    prev_button = Wire(name='prev_button')  # Stores the button value from the previous clock cycle.
+    prev_inputs = Bus(len(inputs_i), name='prev_inputs_dbnc')  # Stores the button values from the previous clock cycle.
 
     @seq_logic(clk_i.posedge)
     def next_state_logic():
-        if button_i == prev_button:
+        if inputs_i == prev_inputs:
             # If the current and previous button values are the same, decrement the counter
             # until it reaches zero and then stop.
             if debounce_cnt != 0:
                 debounce_cnt.next = debounce_cnt - 1
         else:
-            # If the current and previous button values aren't the same, then the button must
+            # If any of the current and previous button values aren't the same, then a button must
             # still be bouncing so reset the counter to the debounce interval and try again.
             debounce_cnt.next = debounce_time
 
-        # Store the current button value for comparison during the next clock cycle.
-        prev_button.next = button_i
+        # Store the current button values for comparison during the next clock cycle.
+        prev_inputs.next = inputs_i
 
     @seq_logic(clk_i.posedge)
     def output_logic():
         if debounce_cnt == 0:
-            # Output the stable button value whenever the counter is zero.
-            # Don't use the actual button input value because that could change at any time.
-            button_o.next = prev_button
+            # Output the stable button values whenever the counter is zero.
+            # Don't use the actual button input values because they could change at any time.
+            outputs_o.next = prev_inputs
 
 
 @chunk
 def classic_fsm(clk_i, inputs_i, outputs_o):
-    fsm_state = State('A', 'B', 'C', 'D', name='state')
+    # The FSM states. Input 0 steps forward through them and input 1 steps backward.
+    A, B, C, D = 0, 1, 2, 3
+    fwd = {A: B, B: C, C: D, D: A}
+    bck = {A: D, B: A, C: B, D: C}
+    fsm_state = Bus(2, init_val=A, name='state')
+
+    # Transition table indexed by the current state and the input changes.
+    # Input 0 takes priority if both inputs change at the same time.
+    NEXT_STATE = tuple(
+        fwd[state] if chgs & 0b01 else bck[state] if chgs & 0b10 else state
+        for state in (A, B, C, D)
+        for chgs in range(4)
+    )
     reset_cnt = Bus(2)
 
     prev_inputs = Bus(len(inputs_i), name='prev_inputs')
@@ -50,56 +62,34 @@ def classic_fsm(clk_i, inputs_i, outputs_o):
     # Take the inputs and run them through the debounce circuits.
     dbnc_inputs = Bus(len(inputs_i))  # These are the inputs after debouncing.
     debounce_time = 120000
-    debouncer(clk_i, inputs_i.o[0], dbnc_inputs.i[0], debounce_time)
-    debouncer(clk_i, inputs_i.o[1], dbnc_inputs.i[1], debounce_time)
+    debouncer_bus(clk_i, inputs_i, dbnc_inputs, debounce_time)
 
     # The edge detection of the inputs is now performed on the debounced inputs.
     @comb_logic
     def detect_chg():
         input_chgs.next = dbnc_inputs & ~prev_inputs
 
+    # The address into the transition table is the current state followed by the input changes.
+    table_addr = Bus(len(fsm_state) + len(input_chgs))
+
+    @comb_logic
+    def table_addr_logic():
+        table_addr.next = concat(fsm_state, input_chgs)
+
     @seq_logic(clk_i.posedge)
     def next_state_logic():
         if reset_cnt < reset_cnt.max - 1:
-            fsm_state.next = fsm_state.s.A
+            fsm_state.next = A
             reset_cnt.next = reset_cnt + 1
-        elif fsm_state == fsm_state.s.A:
-            if input_chgs[0]:
-                fsm_state.next = fsm_state.s.B
-            elif input_chgs[1]:
-                fsm_state.next = fsm_state.s.D
-        elif fsm_state == fsm_state.s.B:
-            if input_chgs[0]:
-                fsm_state.next = fsm_state.s.C
-            elif input_chgs[1]:
-                fsm_state.next = fsm_state.s.A
-        elif fsm_state == fsm_state.s.C:
-            if input_chgs[0]:
-                fsm_state.next = fsm_state.s.D
-            elif input_chgs[1]:
-                fsm_state.next = fsm_state.s.B
-        elif fsm_state == fsm_state.s.D:
-            if input_chgs[0]:
-                fsm_state.next = fsm_state.s.A
-            elif input_chgs[1]:
-                fsm_state.next = fsm_state.s.C
         else:
-            fsm_state.next = fsm_state.s.A
+            fsm_state.next = NEXT_STATE[table_addr]  # Look up the next state.
 
         prev_inputs.next = dbnc_inputs  # Store the debounced inputs.
 
     @comb_logic
     def output_logic():
-        if fsm_state == fsm_state.s.A:
-            outputs_o.next = 0b0001
-        elif fsm_state == fsm_state.s.B:
-            outputs_o.next = 0b0010
-        elif fsm_state == fsm_state.s.C:
-            outputs_o.next = 0b0100
-        elif fsm_state == fsm_state.s.D:
-            outputs_o.next = 0b1000
-        else:
-            outputs_o.next = 0b1111
+        # Light the output that corresponds to the current state.
+        outputs_o.next = 1 << fsm_state
 
 
 initialize()
@@ -110,25 +100,32 @@ clk = Wire(name='clk')
 classic_fsm(clk, inputs, outputs)
 
 
+def clk_vector_tb(clk, inputs_i, stim):
+    '''
+    Apply one stimulus vector to the inputs on each clock cycle.
+    Inputs:
+        clk: Clock that gets pulsed once for every stimulus vector.
+        inputs_i: Signal that receives the stimulus vectors.
+        stim: List of values to apply to inputs_i.
+    '''
+    for inputs_i.next in stim:
+        clk.next = 0
+        yield delay(1)
+        clk.next = 1
+        yield delay(1)
+
+
 def fsm_tb():
     nop = 0b00
     fwd = 0b01
     bck = 0b10
 
-    ins = [nop, nop, nop, nop, fwd, fwd, fwd, bck, bck, bck]
-    for inputs.next in ins:
-        clk.next = 0
-        yield delay(1)
-        clk.next = 1
-        yield delay(1)
+    stim = [nop, nop, nop, nop, fwd, fwd, fwd, bck, bck, bck]
 
     # Interspersed active and inactive inputs.
-    ins = [fwd, nop, fwd, nop, fwd, nop, bck, nop, bck, nop, bck, nop]
-    for inputs.next in ins:
-        clk.next = 0
-        yield delay(1)
-        clk.next = 1
-        yield delay(1)
+    stim += [fwd, nop, fwd, nop, fwd, nop, bck, nop, bck, nop, bck, nop]
+
+    return clk_vector_tb(clk, inputs, stim)
 
 
 simulate(fsm_tb())